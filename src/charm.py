@@ -14,6 +14,7 @@ from charms.loki_k8s.v0.loki_push_api import LogProxyConsumer
 from charms.prometheus_k8s.v0.prometheus_scrape import MetricsEndpointProvider
 from charms.rolling_ops.v0.rollingops import RollingOpsManager
 from ops import (
+    ActionEvent,
     ActiveStatus,
     EventBase,
     InstallEvent,
@@ -35,13 +36,12 @@ from events.backup import BackupEvents
 from events.password_actions import PasswordActionEvents
 from events.provider import ProviderEvents
 from events.tls import TLSEvents
-from events.upgrade import ZKUpgradeEvents, ZooKeeperDependencyModel
+from events.upgrade import DEPENDENCY_MODEL, ZKUpgradeEvents
 from literals import (
     CHARM_KEY,
     CHARM_USERS,
     CLIENT_PORT,
     CONTAINER,
-    DEPENDENCIES,
     JMX_PORT,
     LOGS_RULES_DIR,
     METRICS_PROVIDER_PORT,
@@ -61,6 +61,10 @@ logger = logging.getLogger(__name__)
 logging.getLogger("httpx").setLevel(logging.WARNING)
 logging.getLogger("httpcore").setLevel(logging.WARNING)
 
+_METRICS_JOBS = [
+    {"static_configs": [{"targets": [f"*:{JMX_PORT}", f"*:{METRICS_PROVIDER_PORT}"]}]}
+]
+
 
 class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
     """Charmed Operator for ZooKeeper K8s."""
@@ -70,6 +74,7 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
     def __init__(self, *args):
         super().__init__(*args)
         self.name = CHARM_KEY
+        self._last_reconcile_key: tuple[int, int] | None = None
         self.state = ClusterState(self, substrate=SUBSTRATE)
         self.workload = ZKWorkload(container=self.unit.get_container(CONTAINER))
 
@@ -82,9 +87,7 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
         self.upgrade_events = ZKUpgradeEvents(
             self,
             substrate=SUBSTRATE,
-            dependency_model=ZooKeeperDependencyModel(
-                **DEPENDENCIES  # pyright: ignore[reportArgumentType]
-            ),
+            dependency_model=DEPENDENCY_MODEL,
         )
 
         # --- MANAGERS ---
@@ -102,15 +105,17 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
 
         # --- LIB EVENT HANDLERS ---
 
+        # NOTE: these must be constructed on every hook, as they register their observers
+        # (and in the case of rolling-ops, define their custom events) during instantiation
+
         self.restart = RollingOpsManager(self, relation="restart", callback=self._restart)
+        self._acquire_lock = self.on[self.restart.name].acquire_lock
         self.grafana_dashboards = GrafanaDashboardProvider(self)
         self.metrics_endpoint = MetricsEndpointProvider(
             self,
             refresh_event=self.on.start,
             alert_rules_path=METRICS_RULES_DIR,
-            jobs=[
-                {"static_configs": [{"targets": [f"*:{JMX_PORT}", f"*:{METRICS_PROVIDER_PORT}"]}]}
-            ],
+            jobs=_METRICS_JOBS,
         )
         self.loki_push = LogProxyConsumer(
             self,
@@ -121,31 +126,19 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
         )
         # --- CORE EVENTS ---
 
-        self.framework.observe(getattr(self.on, "install"), self._on_install)
-        self.framework.observe(
-            getattr(self.on, "update_status"), self._on_cluster_relation_changed
-        )
-        self.framework.observe(getattr(self.on, "upgrade_charm"), self._on_zookeeper_pebble_ready)
-        self.framework.observe(getattr(self.on, "start"), self._on_zookeeper_pebble_ready)
-        self.framework.observe(
-            getattr(self.on, "zookeeper_pebble_ready"), self._on_zookeeper_pebble_ready
-        )
-        self.framework.observe(
-            getattr(self.on, "leader_elected"), self._on_cluster_relation_changed
-        )
-        self.framework.observe(
-            getattr(self.on, "config_changed"), self._on_cluster_relation_changed
-        )
-        self.framework.observe(getattr(self.on, "secret_changed"), self._on_secret_changed)
-
-        self.framework.observe(
-            getattr(self.on, "cluster_relation_changed"), self._on_cluster_relation_changed
-        )
-        self.framework.observe(
-            getattr(self.on, "cluster_relation_joined"), self._on_cluster_relation_changed
-        )
+        self.framework.observe(self.on.install, self._on_install)
+        self.framework.observe(self.on.update_status, self._on_cluster_relation_changed)
+        self.framework.observe(self.on.upgrade_charm, self._on_zookeeper_pebble_ready)
+        self.framework.observe(self.on.start, self._on_zookeeper_pebble_ready)
+        self.framework.observe(self.on.zookeeper_pebble_ready, self._on_zookeeper_pebble_ready)
+        self.framework.observe(self.on.leader_elected, self._on_cluster_relation_changed)
+        self.framework.observe(self.on.config_changed, self._on_cluster_relation_changed)
+        self.framework.observe(self.on.secret_changed, self._on_secret_changed)
+
+        self.framework.observe(self.on.cluster_relation_changed, self._on_cluster_relation_changed)
+        self.framework.observe(self.on.cluster_relation_joined, self._on_cluster_relation_changed)
         self.framework.observe(
-            getattr(self.on, "cluster_relation_departed"), self._on_cluster_relation_changed
+            self.on.cluster_relation_departed, self._on_cluster_relation_changed
         )
 
     @property
@@ -179,6 +172,11 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
         }
         return Layer(layer_config)
 
+    @property
+    def _reconcile_key(self) -> tuple[int, int]:
+        """Fingerprint of the peer relation data and charm config driving a reconcile."""
+        return (self.state.data_hash, self.config_manager.config_hash)
+
     def update_external_services(self) -> None:
         """Attempts to update any external Kubernetes services."""
         if not SUBSTRATE == "k8s" or not self.unit.is_leader():
@@ -211,8 +209,9 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
             return
 
         if self.unit.is_leader() and not self.state.cluster.internal_user_credentials:
-            for user in CHARM_USERS:
-                self.state.cluster.update({f"{user}-password": self.workload.generate_password()})
+            self.state.cluster.update(
+                {f"{user}-password": self.workload.generate_password() for user in CHARM_USERS}
+            )
 
         # give the leader a default quorum during cluster initialisation
         if self.unit.is_leader():
@@ -234,6 +233,19 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
             self._set_status(Status.NO_PEER_RELATION)
             return
 
+        # skip duplicate reconciles within the same dispatch, e.g re-emitted deferred events
+        # departures and leader changes always run, as they force a quorum update regardless
+        # actions and secret changes always run, as the key can't see secret contents
+        if (
+            self._last_reconcile_key is not None
+            and not isinstance(
+                event, (RelationDepartedEvent, LeaderElectedEvent, ActionEvent, SecretChangedEvent)
+            )
+            and self._reconcile_key == self._last_reconcile_key
+        ):
+            logger.debug("Cluster state and config unchanged since last reconcile, skipping")
+            return
+
         if self.state.cluster.is_restore_in_progress:
             # Ongoing backup restore, we can early return here since the
             # chain of events is only relevant to the backup event handler
@@ -293,7 +305,8 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
             return  # early return here to ensure new node cert arrives before updating the clients
 
         # even if leader has not started, attempt update quorum
-        self.update_quorum(event=event)
+        if self.unit.is_leader():
+            self.update_quorum(event=event)
 
         # don't delay scale-down leader ops by restarting dying unit
         if getattr(event, "departing_unit", None) == self.unit:
@@ -307,7 +320,7 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
             and self.state.unit_server.started
             and self.upgrade_events.idle
         ):
-            self.on[f"{self.restart.name}"].acquire_lock.emit()
+            self._acquire_lock.emit()
 
         # ensures events aren't lost during an upgrade on single units
         if self.state.cluster.switching_encryption and len(self.state.servers) == 1:
@@ -325,6 +338,9 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
         self.unit.set_workload_version(self.workload.get_version())
         self._set_status(Status.ACTIVE)
 
+        # only successful reconciles are memoized, so anything deferred or blocked re-runs
+        self._last_reconcile_key = self._reconcile_key
+
     def _on_secret_changed(self, event: SecretChangedEvent) -> None:
         """Reconfigure services on a secret changed event."""
         if not event.secret.label:
@@ -374,14 +390,19 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
 
         logger.info(f"{self.unit.name} restarting...")
         current_plan = self.workload.container.get_plan()
-        if current_plan.services != self._layer.services:
-            self.workload.start(layer=self._layer)
+        layer = self._layer
+        if current_plan.services != layer.services:
+            self.workload.start(layer=layer)
         else:
             self.workload.restart()
 
         # gives time for server to rejoin quorum, as command exits too fast
         # without, other units might restart before this unit rejoins, losing quorum
-        time.sleep(5)
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            if self.workload.in_quorum:
+                break
+            time.sleep(0.1)
 
         self.state.unit_server.update(
             {
@@ -573,6 +594,12 @@ class ZooKeeperCharm(TypedCharmBase[CharmConfig]):
         log_level: DebugLevel = key.value.log_level
 
         getattr(logger, log_level.lower())(status.message)
+
+        # the first read per hook costs a status-get, but the leader re-sets statuses several
+        # times per hook (update_quorum, update_client_data, final ACTIVE), so skip unchanged writes
+        if self.unit.status == status:
+            return
+
         self.unit.status = status
 
 
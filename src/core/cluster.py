@@ -145,6 +145,19 @@ class ClusterState(Object):
 
         return clients
 
+    @property
+    def data_hash(self) -> int:
+        """Hash of the app and all unit data in the peer relation.
+
+        Used for detecting whether the cluster state has changed between handlers.
+        """
+        return hash(
+            (
+                self.cluster.data_hash,
+                frozenset((server.unit_id, server.data_hash) for server in self.servers),
+            )
+        )
+
     # --- CLUSTER INIT ---
 
     @property
@@ -227,6 +240,8 @@ class ClusterState(Object):
     @property
     def started_servers(self) -> Set[ZKServer]:
         """The server states of all started peer-related Units."""
+        # NOTE: not cached, as the unit flags itself as 'started' mid-hook during `init_server`
+        # and the leader relies on seeing that in the same hook when updating the quorum
         return {server for server in self.servers if server.started}
 
     @property
@@ -10,7 +10,12 @@ from collections.abc import MutableMapping
 from functools import cached_property
 from typing import Literal
 
-from charms.data_platform_libs.v0.data_interfaces import Data, DataPeerData, DataPeerUnitData
+from charms.data_platform_libs.v0.data_interfaces import (
+    Data,
+    DataPeerData,
+    DataPeerUnitData,
+    get_encoded_list,
+)
 from ops.model import Application, Relation, Unit
 from typing_extensions import deprecated, override
 
@@ -51,6 +56,23 @@ class RelationState:
         """Data representing the state."""
         return self.relation_data
 
+    @property
+    def data_hash(self) -> int:
+        """Hash of the raw databag representing the state.
+
+        Secret fields are only represented by their secret URIs, as resolving their contents
+        costs a backend call per field.
+        """
+        if not self.relation or not self.component:
+            return hash(frozenset())
+
+        return hash(frozenset(self.relation.data[self.component].items()))
+
+    @property
+    def secret_fields(self) -> set[str]:
+        """The fields written as Juju Secrets, rather than to the raw databag."""
+        return set(getattr(self.data_interface, "secret_fields", None) or [])
+
     def update(self, items: dict[str, str]) -> None:
         """Writes to relation_data."""
         if not self.relation:
@@ -59,10 +81,19 @@ class RelationState:
             )
             return
 
-        delete_fields = [key for key in items if not items[key]]
-        update_content = {k: items[k] for k in items if k not in delete_fields}
+        # only touching non-secret keys whose value changes in the raw databag
+        # secret fields are always passed through, as resolving them costs a call per field
+        secret_fields = self.secret_fields
+        raw_data = self.relation.data[self.data_interface.component]
+        changed = {
+            k: v for k, v in items.items() if k in secret_fields or raw_data.get(k, "") != v
+        }
+
+        delete_fields = [key for key in changed if not changed[key]]
+        update_content = {k: v for k, v in changed.items() if v}
 
-        self.relation_data.update(update_content)
+        if update_content:
+            self.relation_data.update(update_content)
 
         for field in delete_fields:
             del self.relation_data[field]
@@ -91,6 +122,15 @@ class ZKClient(RelationState):
         self._uris = uris
         self._local_app = local_app
 
+    @property
+    @override
+    def secret_fields(self) -> set[str]:
+        """The fields requested by the client application to be shared as Juju Secrets."""
+        if not self.relation or not self.relation.app:
+            return set()
+
+        return set(get_encoded_list(self.relation, self.relation.app, "requested-secrets") or [])
+
     @property
     def username(self) -> str:
         """The generated username for the client application."""
@@ -204,6 +244,7 @@ class ZKCluster(RelationState):
         if not self.relation:
             return
 
+        relation_items = {}
         for key, value in items.items():
             if key in SECRETS_APP or key.startswith("relation-"):
                 if value:
@@ -211,7 +252,11 @@ class ZKCluster(RelationState):
                 else:
                     self.data_interface.delete_secret(self.relation.id, key)
             else:
-                self.data_interface.update_relation_data(self.relation.id, {key: value})
+                relation_items[key] = value
+
+        # non-secret fields are written together, rather than one call per field
+        if relation_items:
+            self.data_interface.update_relation_data(self.relation.id, relation_items)
 
     @property
     def quorum_unit_ids(self) -> list[int]:
@@ -127,6 +127,9 @@ class TLSEvents(Object):
         self.charm.tls_manager.set_certificate()
         self.charm.tls_manager.set_truststore()
         self.charm.tls_manager.set_p12_keystore()
+
+        # renewed certificates keep their secret URIs, so the reconcile key can't see them
+        self.charm._last_reconcile_key = None
         self.charm.on.config_changed.emit()
 
     def _on_certificate_expiring(self, _: EventBase) -> None:
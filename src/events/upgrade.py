@@ -4,6 +4,7 @@
 
 """Upgrades implementation."""
 import logging
+import random
 from typing import TYPE_CHECKING
 
 from charms.data_platform_libs.v0.upgrade import (
@@ -18,10 +19,10 @@ from lightkube.resources.apps_v1 import StatefulSet
 from ops.framework import EventBase
 from ops.model import ModelError
 from pydantic import BaseModel
-from tenacity import retry, stop_after_attempt, wait_random
+from tenacity import nap, retry, stop_after_attempt, wait_random
 from typing_extensions import override
 
-from literals import CONTAINER
+from literals import CONTAINER, DEPENDENCIES
 
 if TYPE_CHECKING:
     from charm import ZooKeeperCharm
@@ -35,6 +36,9 @@ class ZooKeeperDependencyModel(BaseModel):
     service: DependencyModel
 
 
+DEPENDENCY_MODEL = ZooKeeperDependencyModel(**DEPENDENCIES)  # pyright: ignore[reportArgumentType]
+
+
 class ZKUpgradeEvents(DataUpgrade):
     """Implementation of :class:`DataUpgrade` overrides for in-place upgrades."""
 
@@ -81,9 +85,26 @@ class ZKUpgradeEvents(DataUpgrade):
         """
         return not bool(self.upgrade_stack)
 
-    @retry(stop=stop_after_attempt(5), wait=wait_random(min=1, max=5), reraise=True)
     def post_upgrade_check(self) -> None:
-        """Runs necessary checks validating the unit is in a healthy state after upgrade."""
+        """Runs necessary checks validating the unit is in a healthy state after upgrade.
+
+        Checks are only retried if the first attempt fails.
+        """
+        try:
+            self._check_upgraded_unit()
+        except Exception as e:
+            logger.debug(f"Post-upgrade check failed, retrying - {e}")
+            # gives the unit time to rejoin the quorum before the first retry
+            nap.sleep(random.uniform(1, 5))
+            self._retry_check_upgraded_unit()
+
+    @retry(stop=stop_after_attempt(4), wait=wait_random(min=1, max=5), reraise=True)
+    def _retry_check_upgraded_unit(self) -> None:
+        """Retries the post-upgrade checks, giving the unit time to rejoin the quorum."""
+        self._check_upgraded_unit()
+
+    def _check_upgraded_unit(self) -> None:
+        """Validates the upgraded unit is synced with the quorum, and serving requests."""
         self.pre_upgrade_check()
 
         if not self.charm.workload.healthy:
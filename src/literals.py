@@ -16,7 +16,7 @@ CHARM_KEY = "zookeeper-k8s"
 PEER = "cluster"
 REL_NAME = "zookeeper"
 CONTAINER = "zookeeper"
-CHARM_USERS = ["super", "sync"]
+CHARM_USERS = ("super", "sync")
 CERTS_REL_NAME = "certificates"
 CLIENT_PORT = 2181
 SECURE_CLIENT_PORT = 2182
@@ -63,7 +63,7 @@ LOGS_RULES_DIR = "./src/alert_rules/loki"
 DebugLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR"]
 
 
-@dataclass
+@dataclass(slots=True)
 class StatusLevel:
     status: StatusBase
     log_level: DebugLevel
@@ -112,7 +112,7 @@ class Status(Enum):
     SERVICE_UNAVAILABLE = StatusLevel(MaintenanceStatus("waiting for k8s service"), "INFO")
 
 
-SECRETS_APP = ["sync-password", "super-password"]
+SECRETS_APP = frozenset({"sync-password", "super-password"})
 SECRETS_UNIT = [
     "ca-cert",
     "csr",
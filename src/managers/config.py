@@ -63,6 +63,11 @@ class ConfigManager:
         self.substrate = substrate
         self.config = config
 
+    @property
+    def config_hash(self) -> int:
+        """Hash of the current charm config options."""
+        return hash(frozenset(self.config.dict().items()))
+
     @property
     def log_level(self) -> str:
         """Return the Java-compliant logging level set by the user.
@@ -144,14 +144,17 @@ class QuorumManager:
             servers_to_remove = list(zk_members - active_server_strings)
             logger.debug(f"{servers_to_remove=}")
 
-            self.client.remove_members(members=servers_to_remove)
+            # each client call opens a new connection, so skip them if nothing changes
+            if servers_to_remove:
+                self.client.remove_members(members=servers_to_remove)
+                zk_members = self.client.server_members
 
             # sorting units to ensure units are added in id order
-            zk_members = self.client.server_members
             servers_to_add = sorted(active_server_strings - zk_members)
             logger.debug(f"{servers_to_add=}")
 
-            self.client.add_members(members=servers_to_add)
+            if servers_to_add:
+                self.client.add_members(members=servers_to_add)
 
             return self._get_updated_servers(add=servers_to_add, remove=servers_to_remove)
 
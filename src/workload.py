@@ -25,6 +25,10 @@ class ZKWorkload(WorkloadBase):
     def __init__(self, container: Container):
         self.container = container
 
+        # positive check results are cached for the hook, reset when the service changes
+        self._alive = False
+        self._healthy = False
+
     @override
     def start(self, layer: Layer) -> None:
         # ensures paths exist on mounted storage to use
@@ -36,14 +40,18 @@ class ZKWorkload(WorkloadBase):
             self.container.replan()
         except ChangeError:
             return
+        finally:
+            self._reset_checks()
 
     @override
     def stop(self) -> None:
         self.container.stop(self.container.name)
+        self._reset_checks()
 
     @override
     def restart(self) -> None:
         self.container.restart(self.container.name)
+        self._reset_checks()
 
     @override
     def read(self, path: str) -> list[str]:
@@ -63,10 +71,14 @@ class ZKWorkload(WorkloadBase):
     @property
     @override
     def alive(self) -> bool:
+        if self._alive:
+            return True
+
         if not self.container_can_connect:
             return False
 
-        return self.container.get_service(self.container.name).is_running()
+        self._alive = self.container.get_service(self.container.name).is_running()
+        return self._alive
 
     @property
     def container_can_connect(self) -> bool:
@@ -75,14 +87,26 @@ class ZKWorkload(WorkloadBase):
 
     @property
     @override
+    def healthy(self) -> bool:
+        """Flag to check if the unit service is reachable and serving requests."""
+        if not self._healthy:
+            self._healthy = self._ruok()
+
+        return self._healthy
+
+    def _reset_checks(self) -> None:
+        """Clears cached liveness and health results, after the service state has changed."""
+        self._alive = False
+        self._healthy = False
+
     @retry(
         wait=wait_fixed(1),
         stop=stop_after_attempt(5),
         retry=retry_if_result(lambda result: result is False),
         retry_error_callback=lambda _: False,
     )
-    def healthy(self) -> bool:
-        """Flag to check if the unit service is reachable and serving requests."""
+    def _ruok(self) -> bool:
+        """Queries the service `ruok` admin command, retrying on failure."""
         if not self.alive:
             return False
 
@@ -100,6 +124,18 @@ class ZKWorkload(WorkloadBase):
 
     # --- ZK Specific ---
 
+    @property
+    def in_quorum(self) -> bool:
+        """Flag to check if the unit service has joined, and is broadcasting with, the quorum."""
+        try:
+            response = httpx.get(f"http://localhost:{ADMIN_SERVER_PORT}/commands/mntr", timeout=1)
+            response.raise_for_status()
+
+        except httpx.HTTPError:
+            return False
+
+        return "broadcast" in response.json().get("peer_state", "")
+
     def install(self) -> None:
         """Loads the ZooKeeper snap from LP, returning a StatusBase for the Charm to set."""
         raise NotImplementedError
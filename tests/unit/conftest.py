@@ -20,9 +20,10 @@ def patched_idle(mocker, request):
         )
 
 
-@pytest.fixture(autouse=True)
-def patched_wait(mocker):
-    mocker.patch("tenacity.nap.time")
+@pytest.fixture(autouse=True, scope="session")
+def patched_wait():
+    with patch("tenacity.nap.time"):
+        yield
 
 
 @pytest.fixture(autouse=True)
@@ -30,9 +31,10 @@ def patched_set_rolling_update_partition(mocker):
     mocker.patch("events.upgrade.ZKUpgradeEvents._set_rolling_update_partition")
 
 
-@pytest.fixture(autouse=True)
-def patched_pebble_restart(mocker):
-    mocker.patch("ops.model.Container.restart")
+@pytest.fixture(autouse=True, scope="session")
+def patched_pebble_restart():
+    with patch("ops.model.Container.restart"):
+        yield
 
 
 @pytest.fixture(autouse=True)
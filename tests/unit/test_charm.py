@@ -13,6 +13,7 @@ from unittest.mock import DEFAULT, Mock, PropertyMock, patch
 import httpx
 import pytest
 import yaml
+from ops import RelationDepartedEvent
 from ops.model import ActiveStatus, BlockedStatus
 from ops.testing import Container, Context, PeerRelation, Relation, State
 
@@ -305,6 +306,34 @@ def test_relation_changed_updates_quorum(ctx: Context, base_state: State) -> Non
     patched.assert_called_once()
 
 
+def test_relation_changed_skips_update_quorum_if_not_leader(
+    ctx: Context, base_state: State
+) -> None:
+    # Given
+    cluster_peer = PeerRelation(
+        PEER, PEER, local_app_data={}, local_unit_data={"state": "started"}
+    )
+    restart_peer = PeerRelation("restart", "rolling_op")
+    state_in = dataclasses.replace(
+        base_state, relations=[cluster_peer, restart_peer], leader=False
+    )
+
+    # When
+    with (
+        patch("charm.ZooKeeperCharm.update_quorum") as patched,
+        patch("managers.config.ConfigManager.config_changed"),
+        patch("core.cluster.ClusterState.all_units_related", return_value=True),
+        patch("core.cluster.ClusterState.all_units_declaring_ip", return_value=True),
+        patch(
+            "charms.rolling_ops.v0.rollingops.RollingOpsManager._on_acquire_lock", autospec=True
+        ),
+    ):
+        ctx.run(ctx.on.config_changed(), state_in)
+
+    # Then
+    patched.assert_not_called()
+
+
 def test_relation_changed_restarts(ctx: Context, base_state: State) -> None:
     # Given
     cluster_peer = PeerRelation(
@@ -394,6 +423,122 @@ def test_relation_changed_checks_alive_and_healthy(ctx: Context, base_state: Sta
     patched_healthy.assert_called()
 
 
+def test_relation_changed_skips_duplicate_reconcile(ctx: Context, base_state: State) -> None:
+    # Given
+    cluster_peer = PeerRelation(
+        PEER,
+        PEER,
+        local_unit_data={"state": "started"},
+        peers_data={},
+    )
+    restart_peer = PeerRelation("restart", "rolling_op")
+    state_in = dataclasses.replace(base_state, relations=[cluster_peer, restart_peer])
+
+    # When
+    with (
+        patch("core.cluster.ClusterState.all_units_related", return_value=True),
+        patch("core.cluster.ClusterState.all_units_declaring_ip", return_value=True),
+        patch("charm.ZooKeeperCharm.update_quorum"),
+        patch("managers.config.ConfigManager.config_changed", return_value=False) as patched,
+        ctx(ctx.on.config_changed(), state_in) as manager,
+    ):
+        charm = cast(ZooKeeperCharm, manager.charm)
+        charm._on_cluster_relation_changed(Mock())
+        charm._on_cluster_relation_changed(Mock())
+
+    # Then
+    patched.assert_called_once()
+
+
+def test_relation_departed_runs_after_memoized_reconcile(ctx: Context, base_state: State) -> None:
+    # Given
+    cluster_peer = PeerRelation(
+        PEER,
+        PEER,
+        local_unit_data={"state": "started"},
+        peers_data={},
+    )
+    restart_peer = PeerRelation("restart", "rolling_op")
+    state_in = dataclasses.replace(base_state, relations=[cluster_peer, restart_peer])
+
+    # When
+    with (
+        patch("core.cluster.ClusterState.all_units_related", return_value=True),
+        patch("core.cluster.ClusterState.all_units_declaring_ip", return_value=True),
+        patch("managers.config.ConfigManager.config_changed", return_value=False),
+        patch("charm.ZooKeeperCharm.update_quorum") as patched,
+        ctx(ctx.on.config_changed(), state_in) as manager,
+    ):
+        charm = cast(ZooKeeperCharm, manager.charm)
+        charm._on_cluster_relation_changed(Mock())
+        charm._on_cluster_relation_changed(Mock(spec=RelationDepartedEvent))
+
+    # Then
+    assert patched.call_count == 2
+
+
+def test_set_password_reconciles_after_deferred_reconcile(ctx: Context, base_state: State) -> None:
+    # Given
+    cluster_peer = PeerRelation(
+        PEER,
+        PEER,
+        local_unit_data={"state": "started"},
+        peers_data={},
+    )
+    restart_peer = PeerRelation("restart", "rolling_op")
+    state_in = dataclasses.replace(
+        base_state,
+        relations=[cluster_peer, restart_peer],
+        deferred=[
+            ctx.on.update_status().deferred(handler=ZooKeeperCharm._on_cluster_relation_changed)
+        ],
+    )
+
+    # When
+    with (
+        patch("core.cluster.ClusterState.all_units_related", return_value=True),
+        patch("core.cluster.ClusterState.all_units_declaring_ip", return_value=True),
+        patch("charm.ZooKeeperCharm.update_quorum"),
+        patch("managers.config.ConfigManager.config_changed", return_value=False) as patched,
+    ):
+        ctx.run(
+            ctx.on.action("set-password", params={"username": "super", "password": "mellon"}),
+            state_in,
+        )
+
+    # Then
+    assert patched.call_count == 2
+
+
+def test_reconcile_key_skips_secret_resolution(ctx: Context, base_state: State) -> None:
+    # Given
+    cluster_peer = PeerRelation(
+        PEER,
+        PEER,
+        local_unit_data={"state": "started"},
+        peers_data={1: {"state": "started"}, 2: {"state": "started"}},
+    )
+    state_in = dataclasses.replace(base_state, relations=[cluster_peer])
+
+    # When
+    with ctx(ctx.on.start(), state_in) as manager:
+        charm = cast(ZooKeeperCharm, manager.charm)
+
+        with (
+            patch(
+                "charms.data_platform_libs.v0.data_interfaces.DataPeerData.fetch_my_relation_data"
+            ) as patched_fetch_my,
+            patch(
+                "charms.data_platform_libs.v0.data_interfaces.DataPeerData.fetch_relation_data"
+            ) as patched_fetch,
+        ):
+            charm._reconcile_key
+
+    # Then
+    patched_fetch_my.assert_not_called()
+    patched_fetch.assert_not_called()
+
+
 def test_restart_fails_not_related(ctx: Context, base_state: State) -> None:
     # Given
     cluster_peer = PeerRelation(PEER, PEER)
@@ -458,7 +603,7 @@ def test_restart_fails_not_added(ctx: Context, base_state: State) -> None:
     patched.assert_not_called()
 
 
-def test_restart_restarts_with_sleep(ctx: Context, base_state: State) -> None:
+def test_restart_waits_for_quorum_rejoin(ctx: Context, base_state: State) -> None:
     # Given
     cluster_peer = PeerRelation(
         PEER, PEER, local_unit_data={"state": "started"}, local_app_data={"0": "added"}
@@ -473,6 +618,9 @@ def test_restart_restarts_with_sleep(ctx: Context, base_state: State) -> None:
     with (
         patch("time.sleep") as patched_sleep,
         patch("workload.ZKWorkload.restart"),
+        patch(
+            "workload.ZKWorkload.in_quorum", new_callable=PropertyMock, side_effect=[False, True]
+        ) as patched_in_quorum,
         patch(
             "core.cluster.ClusterState.stable",
             new_callable=PropertyMock,
@@ -488,6 +636,7 @@ def test_restart_restarts_with_sleep(ctx: Context, base_state: State) -> None:
         charm._restart(mock_event)
 
     # Then
+    assert patched_in_quorum.call_count == 2
     patched_sleep.assert_called_once()
 
 
@@ -515,6 +664,7 @@ def test_restart_restarts_snap_sets_active_status(ctx: Context, base_state: Stat
             return_value=Status.ACTIVE,
         ),
         patch("time.sleep"),
+        patch("workload.ZKWorkload.in_quorum", new_callable=PropertyMock, return_value=True),
         patch(
             "charms.rolling_ops.v0.rollingops.RollingOpsManager._on_acquire_lock",
             autospec=True,
@@ -549,6 +699,7 @@ def test_restart_sets_password_rotated_on_unit(ctx: Context, base_state: State)
             return_value=Status.ACTIVE,
         ),
         patch("time.sleep"),
+        patch("workload.ZKWorkload.in_quorum", new_callable=PropertyMock, return_value=True),
         patch(
             "charms.rolling_ops.v0.rollingops.RollingOpsManager._on_acquire_lock",
             autospec=True,
@@ -586,6 +737,7 @@ def test_restart_sets_unified(ctx: Context, base_state: State) -> None:
             return_value=Status.ACTIVE,
         ),
         patch("time.sleep"),
+        patch("workload.ZKWorkload.in_quorum", new_callable=PropertyMock, return_value=True),
         patch(
             "charms.rolling_ops.v0.rollingops.RollingOpsManager._on_acquire_lock",
             autospec=True,
@@ -613,6 +765,7 @@ def test_restart_sets_unified(ctx: Context, base_state: State) -> None:
             return_value=Status.ACTIVE,
         ),
         patch("time.sleep"),
+        patch("workload.ZKWorkload.in_quorum", new_callable=PropertyMock, return_value=True),
         patch(
             "charms.rolling_ops.v0.rollingops.RollingOpsManager._on_acquire_lock",
             autospec=True,
@@ -1176,6 +1329,7 @@ def test_restart_fails_update_relation_data_if_not_ready(ctx: Context, base_stat
     with (
         patch("core.models.ZKClient.update") as patched_update,
         patch("workload.ZKWorkload.restart"),
+        patch("workload.ZKWorkload.in_quorum", new_callable=PropertyMock, return_value=True),
         patch(
             "core.cluster.ClusterState.stable",
             new_callable=PropertyMock,
@@ -1206,6 +1360,7 @@ def test_restart_fails_update_relation_data_if_not_idle(ctx: Context, base_state
     with (
         patch("core.models.ZKClient.update") as patched_update,
         patch("workload.ZKWorkload.restart"),
+        patch("workload.ZKWorkload.in_quorum", new_callable=PropertyMock, return_value=True),
         patch(
             "core.cluster.ClusterState.stable",
             new_callable=PropertyMock,
@@ -1275,6 +1430,54 @@ def test_port_updates_if_tls(ctx: Context, base_state: State) -> None:
             assert client.uris != uris
 
 
+def test_update_client_data_skips_unchanged_clients(ctx: Context, base_state: State) -> None:
+    # Given
+    client_relation = Relation(
+        REL_NAME,
+        "application",
+        remote_app_data={"database": "app"},
+    )
+    cluster_peer = PeerRelation(
+        PEER,
+        PEER,
+        local_unit_data={"state": "started"},
+        local_app_data={f"relation-{client_relation.id}": "mellon"},
+    )
+    state_in = dataclasses.replace(base_state, relations=[cluster_peer, client_relation])
+
+    # When
+    with (
+        patch(
+            "core.cluster.ClusterState.ready",
+            new_callable=PropertyMock,
+            return_value=Status.ACTIVE,
+        ),
+        patch(
+            "managers.config.ConfigManager.current_jaas",
+            new_callable=PropertyMock,
+            return_value=["mellon"],
+        ),
+        ctx(ctx.on.start(), state_in) as manager,
+    ):
+        charm = cast(ZooKeeperCharm, manager.charm)
+        charm.update_client_data()
+        assert charm.model.get_relation(REL_NAME, client_relation.id).data[charm.app]
+
+        with (
+            patch(
+                "charms.data_platform_libs.v0.data_interfaces.DatabaseProviderData.update_relation_data"
+            ) as patched_update,
+            patch(
+                "charms.data_platform_libs.v0.data_interfaces.DatabaseProviderData.delete_relation_data"
+            ) as patched_delete,
+        ):
+            charm.update_client_data()
+
+    # Then
+    patched_update.assert_not_called()
+    patched_delete.assert_not_called()
+
+
 def test_update_relation_data(ctx: Context, base_state: State) -> None:
     # Given
     client_1_relation = Relation(
@@ -1401,6 +1604,24 @@ def test_update_relation_data(ctx: Context, base_state: State) -> None:
             passwords.append(client.password)
 
 
+def test_set_status_skips_unchanged_status(ctx: Context, base_state: State) -> None:
+    # Given
+    state_in = base_state
+
+    # When
+    with ctx(ctx.on.update_status(), state_in) as manager:
+        charm = cast(ZooKeeperCharm, manager.charm)
+
+        with patch.object(
+            charm.unit._backend, "status_set", wraps=charm.unit._backend.status_set
+        ) as patched_status_set:
+            charm._set_status(Status.NOT_UNIT_TURN)
+            charm._set_status(Status.NOT_UNIT_TURN)
+
+    # Then
+    patched_status_set.assert_called_once()
+
+
 @pytest.mark.nopatched_version
 def test_workload_version_is_setted(ctx: Context, base_state: State, monkeypatch):
     # Given
@@ -477,3 +477,49 @@ def test_all_units_quorum_succeeds(ctx: Context, base_state: State) -> None:
 
         # Then
         assert charm.state.all_units_quorum
+
+
+def test_cluster_update_writes_relation_data_once(ctx: Context, base_state: State) -> None:
+    # Given
+    cluster_peer = PeerRelation(PEER, PEER)
+    state_in = dataclasses.replace(base_state, relations=[cluster_peer])
+
+    # When
+    with ctx(ctx.on.config_changed(), state_in) as manager:
+        charm = cast(ZooKeeperCharm, manager.charm)
+
+        with patch(
+            "charms.data_platform_libs.v0.data_interfaces.DataPeerData.update_relation_data"
+        ) as patched_update:
+            charm.state.cluster.update({"0": "added", "1": "removed", "quorum": "ssl"})
+
+    # Then
+    patched_update.assert_called_once_with(
+        cluster_peer.id, {"0": "added", "1": "removed", "quorum": "ssl"}
+    )
+
+
+def test_server_update_skips_unchanged_flags(ctx: Context, base_state: State) -> None:
+    # Given
+    cluster_peer = PeerRelation(PEER, PEER, local_unit_data={"quorum": "ssl", "unified": "true"})
+    state_in = dataclasses.replace(base_state, relations=[cluster_peer])
+
+    # When
+    with ctx(ctx.on.config_changed(), state_in) as manager:
+        charm = cast(ZooKeeperCharm, manager.charm)
+
+        with (
+            patch(
+                "charms.data_platform_libs.v0.data_interfaces.DataPeerData.update_relation_data"
+            ) as patched_update,
+            patch(
+                "charms.data_platform_libs.v0.data_interfaces.DataPeerData.delete_relation_data"
+            ) as patched_delete,
+        ):
+            charm.state.unit_server.update(
+                {"quorum": "ssl", "unified": "true", "password-rotated": ""}
+            )
+
+    # Then
+    patched_update.assert_not_called()
+    patched_delete.assert_not_called()
@@ -6,7 +6,7 @@ import dataclasses
 import logging
 from pathlib import Path
 from typing import cast
-from unittest.mock import DEFAULT, MagicMock, patch
+from unittest.mock import DEFAULT, MagicMock, PropertyMock, patch
 
 import pytest
 import yaml
@@ -85,6 +85,29 @@ def test_get_updated_servers_implicit_removal(ctx: Context, base_state: State) -
     assert updated_servers == {"1": "added", "4": "removed"}
 
 
+def test_update_cluster_skips_reconfig_if_unchanged(ctx: Context, base_state: State) -> None:
+    # Given
+    cluster_peer = PeerRelation(PEER, PEER, local_unit_data={"state": "started"})
+    state_in = dataclasses.replace(base_state, relations=[cluster_peer])
+
+    # When
+    with ctx(ctx.on.start(), state_in) as manager:
+        charm = cast(ZooKeeperCharm, manager.charm)
+        with patch.multiple(
+            "charms.zookeeper.v0.client.ZooKeeperManager",
+            get_leader=DEFAULT,
+            server_members=PropertyMock(return_value={charm.state.unit_server.server_string}),
+            remove_members=DEFAULT,
+            add_members=DEFAULT,
+        ) as patched_manager:
+            updated_servers = charm.quorum_manager.update_cluster()
+
+    # Then
+    assert not updated_servers
+    patched_manager["remove_members"].assert_not_called()
+    patched_manager["add_members"].assert_not_called()
+
+
 def test_is_child_of(ctx: Context, base_state: State) -> None:
     # Given
     chroot = "/gandalf/the/white"
@@ -199,6 +199,56 @@ def test_pre_upgrade_check_succeeds(ctx: Context, base_state: State, mocker) ->
         charm.upgrade_events.pre_upgrade_check()
 
 
+def test_post_upgrade_check_only_retries_on_failure(
+    ctx: Context, base_state: State, mocker
+) -> None:
+    # Given
+    cluster_peer = PeerRelation(PEER, PEER, peers_data={})
+    restart_relation = PeerRelation("restart", CHARM_KEY)
+    state_in = dataclasses.replace(base_state, relations=[cluster_peer, restart_relation])
+    patched_check = mocker.patch.object(
+        ZKUpgradeEvents,
+        "_check_upgraded_unit",
+        side_effect=[None, ClusterNotReadyError(message="", cause=""), None],
+    )
+
+    # When
+    with ctx(ctx.on.start(), state_in) as manager:
+        charm = cast(ZooKeeperCharm, manager.charm)
+        charm.upgrade_events.post_upgrade_check()
+        assert patched_check.call_count == 1
+
+        charm.upgrade_events.post_upgrade_check()
+
+    # Then
+    assert patched_check.call_count == 3
+
+
+def test_post_upgrade_check_retries_five_times_in_total(
+    ctx: Context, base_state: State, mocker
+) -> None:
+    # Given
+    cluster_peer = PeerRelation(PEER, PEER, peers_data={})
+    restart_relation = PeerRelation("restart", CHARM_KEY)
+    state_in = dataclasses.replace(base_state, relations=[cluster_peer, restart_relation])
+    patched_check = mocker.patch.object(
+        ZKUpgradeEvents,
+        "_check_upgraded_unit",
+        side_effect=ClusterNotReadyError(message="", cause=""),
+    )
+    patched_sleep = mocker.patch("tenacity.nap.sleep")
+
+    # When
+    with ctx(ctx.on.start(), state_in) as manager:
+        charm = cast(ZooKeeperCharm, manager.charm)
+        with pytest.raises(ClusterNotReadyError):
+            charm.upgrade_events.post_upgrade_check()
+
+    # Then
+    assert patched_check.call_count == 5
+    patched_sleep.assert_called_once()
+
+
 @pytest.mark.skipif(SUBSTRATE == "k8s", reason="Upgrade stack not built on K8s charms")
 def test_build_upgrade_stack(ctx: Context, base_state: State) -> None:
     # Given
@@ -61,3 +61,46 @@ def test_healthy_does_not_raise(ctx: Context, base_state: State, patched_healthy
     ):
         charm = cast(ZooKeeperCharm, manager.charm)
         assert not charm.workload.healthy
+
+
+def test_healthy_caches_until_restart(ctx: Context, base_state: State, patched_healthy) -> None:
+    # Given
+    state_in = base_state
+
+    # When
+    with (
+        patch("workload.httpx.get") as patched_get,
+        ctx(ctx.on.start(), state_in) as manager,
+    ):
+        patched_get.return_value.json.return_value = {}
+        charm = cast(ZooKeeperCharm, manager.charm)
+
+        assert charm.workload.healthy
+        assert charm.workload.healthy
+        assert patched_get.call_count == 1
+
+        charm.workload.restart()
+        assert charm.workload.healthy
+
+    # Then
+    assert patched_get.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "peer_state,expected",
+    [("following - broadcast", True), ("following - synchronization", False)],
+)
+def test_in_quorum(ctx: Context, base_state: State, peer_state: str, expected: bool) -> None:
+    # Given
+    state_in = base_state
+
+    # When
+    with (
+        patch("workload.httpx.get") as patched_get,
+        ctx(ctx.on.start(), state_in) as manager,
+    ):
+        patched_get.return_value.json.return_value = {"peer_state": peer_state}
+        charm = cast(ZooKeeperCharm, manager.charm)
+
+        # Then
+        assert charm.workload.in_quorum == expected